@@ -0,0 +1,23 @@
+"""Index users.revenuecat_id
+
+Revision ID: 003_index_revenuecat_id
+Revises: 002_add_subscription
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '003_index_revenuecat_id'
+down_revision = '002_add_subscription'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Webhook lookups filter on revenuecat_id (email is already uniquely indexed)
+    op.create_index('ix_users_revenuecat_id', 'users', ['revenuecat_id'])
+
+
+def downgrade():
+    op.drop_index('ix_users_revenuecat_id', table_name='users')
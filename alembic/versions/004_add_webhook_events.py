@@ -0,0 +1,29 @@
+"""Add webhook_events table
+
+Revision ID: 004_add_webhook_events
+Revises: 003_index_revenuecat_id
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '004_add_webhook_events'
+down_revision = '003_index_revenuecat_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Processed RevenueCat event ids, used to skip redelivered webhooks
+    op.create_table(
+        'webhook_events',
+        sa.Column('id', sa.String(100), primary_key=True),
+        sa.Column('event_type', sa.String(50), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table('webhook_events')
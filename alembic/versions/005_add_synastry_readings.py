@@ -0,0 +1,30 @@
+"""Add synastry_readings table
+
+Revision ID: 005_add_synastry_readings
+Revises: 004_add_webhook_events
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '005_add_synastry_readings'
+down_revision = '004_add_webhook_events'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # AI synastry readings shared across workers and restarts
+    op.create_table(
+        'synastry_readings',
+        sa.Column('sign1', sa.String(20), primary_key=True),
+        sa.Column('sign2', sa.String(20), primary_key=True),
+        sa.Column('reading', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table('synastry_readings')
@@ -0,0 +1,36 @@
+"""Index tarot_history by user, position and date
+
+Revision ID: 006_index_tarot_history
+Revises: 005_add_synastry_readings
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '006_index_tarot_history'
+down_revision = '005_add_synastry_readings'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Daily card and spread lookups filter on user and position, newest first.
+    # Built concurrently so the growing history table isn't locked for writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tarot_history_user_position_date',
+            'tarot_history',
+            ['user_id', 'position', sa.text('reading_date DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tarot_history_user_position_date',
+            table_name='tarot_history',
+            postgresql_concurrently=True,
+        )
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
 
     # Gemini AI
     gemini_api_key: str = ""
+    gemini_max_connections: int = 200
+    gemini_max_keepalive: int = 100
 
     # App
     app_name: str = "Horoscope API"
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .config import get_settings
@@ -9,12 +11,31 @@ from .routers import (
     astro_chat_router, synastry_router, pdf_report_router,
     moon_phases_router, affirmations_router
 )
+from .routers.natal_chart import warm_up_ephemeris
 
 settings = get_settings()
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Touch ephemeris segments before the first request arrives
+    warm_up_ephemeris()
+    # One pooled client for Gemini calls; HTTP/2 multiplexes concurrent readings
+    app.state.gemini_client = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=settings.gemini_max_connections,
+            max_keepalive_connections=settings.gemini_max_keepalive,
+        ),
+    )
+    yield
+    await app.state.gemini_client.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
@@ -22,6 +43,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan,
 )
 
 # CORS middleware
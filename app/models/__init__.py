@@ -1,6 +1,8 @@
 from .user import User, AuthProvider, SubscriptionTier
 from .journal import JournalEntry, ManifestationStatus
 from .tarot_history import TarotHistory
+from .webhook_event import WebhookEvent
+from .synastry_reading import SynastryReading
 
 __all__ = [
     "User",
@@ -9,4 +11,6 @@ __all__ = [
     "JournalEntry",
     "ManifestationStatus",
     "TarotHistory",
+    "WebhookEvent",
+    "SynastryReading",
 ]
@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime
+from ..database import Base
+
+
+class SynastryReading(Base):
+    __tablename__ = "synastry_readings"
+
+    # One stored Gemini reading per ordered sign pair
+    sign1 = Column(String(20), primary_key=True)
+    sign2 = Column(String(20), primary_key=True)
+    reading = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SynastryReading {self.sign1}-{self.sign2}>"
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -21,5 +21,10 @@ class TarotHistory(Base):
     # Relationship
     user = relationship("User", back_populates="tarot_history")
 
+    # Serves the "already drew today" lookups in the daily card and spread endpoints
+    __table_args__ = (
+        Index("ix_tarot_history_user_position_date", user_id, position, reading_date.desc()),
+    )
+
     def __repr__(self):
         return f"<TarotHistory {self.card_id}>"
@@ -44,7 +44,7 @@ class User(Base):
     subscription_expires_at = Column(DateTime, nullable=True)
     subscription_platform = Column(String(20), nullable=True)  # "android", "ios"
     subscription_product_id = Column(String(100), nullable=True)
-    revenuecat_id = Column(String(100), nullable=True)  # RevenueCat customer ID
+    revenuecat_id = Column(String(100), nullable=True, index=True)  # RevenueCat customer ID
 
     # Status
     is_email_verified = Column(Boolean, default=False)
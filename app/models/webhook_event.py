@@ -0,0 +1,15 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime
+from ..database import Base
+
+
+class WebhookEvent(Base):
+    __tablename__ = "webhook_events"
+
+    # RevenueCat event id; the primary key makes redelivered events collide
+    id = Column(String(100), primary_key=True)
+    event_type = Column(String(50), nullable=True)
+    processed_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<WebhookEvent {self.id}>"
@@ -1,20 +1,51 @@
 """Natal Chart API using Skyfield for accurate astronomical calculations."""
+import hashlib
+import json
+import math
 from datetime import datetime
-from typing import Optional, List
+from functools import cache, lru_cache
+from typing import Optional, List, Tuple
 from pydantic import BaseModel
-from fastapi import APIRouter
+import httpx
+from fastapi import APIRouter, Depends, Request, Response
 from skyfield.api import load
+from skyfield.constants import ASEC2RAD
+from skyfield.earthlib import earth_rotation_angle
+from skyfield.framelib import ICRS_to_J2000
+from skyfield.functions import mxm, mxv, rot_x
+from skyfield.nutationlib import mean_obliquity
 
-# Load .env for GEMINI_API_KEY
-from dotenv import load_dotenv
-load_dotenv()
+from ..config import get_settings
+from ..utils import get_gemini_client, json_response
 
+settings = get_settings()
 router = APIRouter(prefix="/natal-chart", tags=["Natal Chart"])
 
 # Load planetary ephemeris
 eph = load('de421.bsp')  # JPL ephemeris file (will download ~15MB on first use)
 ts = load.timescale()
 
+
+class MeanEclipticFrame:
+    """Ecliptic and equinox of date using mean obliquity (no nutation).
+
+    Nutation in longitude stays under 20 arcsec, well below the 0.01°
+    rounding applied to chart degrees, so skipping the IAU 2000A series
+    is safe for tropical zodiac positions.
+    """
+
+    @staticmethod
+    def rotation_at(t):
+        obliquity = mean_obliquity(t.tdb) * ASEC2RAD
+        return mxm(rot_x(-obliquity), mxm(t.precession_matrix(), ICRS_to_J2000))
+
+
+mean_ecliptic_frame = MeanEclipticFrame()
+
+GEMINI_STREAM_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:streamGenerateContent"
+
+json_decoder = json.JSONDecoder()
+
 # Zodiac signs
 SIGNS = [
     'aries', 'taurus', 'gemini', 'cancer',
@@ -35,6 +66,20 @@ PLANETS = {
     'neptune': 'neptune barycenter',
 }
 
+# Ephemeris segments resolved once so the request path skips SPK lookups
+EARTH = eph['earth']
+SUN = eph['sun']
+BODIES = {name: eph[target] for name, target in PLANETS.items()}
+
+# Julian dates are rounded to 6 decimals (~0.1 s) before keying position caches
+JD_PRECISION = 6
+
+# Bump whenever chart output changes for the same inputs, invalidating client ETags
+CHART_VERSION = 1
+
+# birth_time layouts accepted, tried in order; seconds are dropped as before
+BIRTH_TIME_FORMATS = ("%H:%M", "%H:%M:%S", "%H")
+
 # Interpretive readings for planets in signs
 PLANET_SIGN_READINGS = {
     'sun': {
@@ -179,6 +224,24 @@ PLANET_SIGN_READINGS = {
     },
 }
 
+# Display names for signs, e.g. 'sagittarius' -> 'Sagittarius'
+SIGN_TITLES = {sign: sign.title() for sign in SIGNS}
+
+# Flat reading table indexed by planet_index * 12 + sign_index
+PLANET_IDX = {name: i for i, name in enumerate(PLANET_SIGN_READINGS)}
+SIGN_IDX = {sign: i for i, sign in enumerate(SIGNS)}
+READINGS_FLAT = tuple(
+    PLANET_SIGN_READINGS[planet].get(sign, '')
+    for planet in PLANET_SIGN_READINGS
+    for sign in SIGNS
+)
+
+# Whole Sign houses: row is the ascendant sign index, column is house number - 1
+HOUSE_SIGNS = tuple(
+    tuple(SIGNS[(asc_index + i) % 12] for i in range(12))
+    for asc_index in range(12)
+)
+
 
 class NatalChartRequest(BaseModel):
     birth_date: str  # YYYY-MM-DD
@@ -210,49 +273,70 @@ class NatalChartResponse(BaseModel):
     summary: str = ""
 
 
+def title_sign(sign: str) -> str:
+    """Title-case a sign name, using the precomputed table for known signs."""
+    return SIGN_TITLES.get(sign) or sign.title()
+
+
+@cache
 def get_reading(planet: str, sign: str) -> str:
     """Get interpretive reading for a planet in a sign."""
-    readings = PLANET_SIGN_READINGS.get(planet, {})
-    return readings.get(sign, f"Your {planet.title()} in {sign.title()} brings unique energy to your chart.")
+    planet_idx = PLANET_IDX.get(planet)
+    sign_idx = SIGN_IDX.get(sign)
+    if planet_idx is not None and sign_idx is not None:
+        reading = READINGS_FLAT[planet_idx * 12 + sign_idx]
+        if reading:
+            return reading
+    return f"Your {planet.title()} in {title_sign(sign)} brings unique energy to your chart."
 
 
 def ecliptic_longitude_to_sign(longitude: float):
     """Convert ecliptic longitude (0-360) to zodiac sign and degree."""
-    sign_index = int(longitude / 30) % 12
-    degree = longitude % 30
-    return SIGNS[sign_index], degree
+    sign_index, degree = divmod(longitude, 30)
+    return SIGNS[int(sign_index) % 12], degree
 
 
-def calculate_planet_position(planet_name: str, t, earth) -> PlanetPositionResponse:
-    """Calculate a planet's ecliptic longitude."""
-    try:
-        if planet_name == 'sun':
-            body = eph['sun']
-        elif planet_name == 'moon':
-            body = eph['moon']
-        else:
-            body = eph[PLANETS.get(planet_name, planet_name)]
+@lru_cache(maxsize=32)
+def _observer_at(jd_tt: float):
+    """Earth's position and ecliptic rotation at a TT Julian date, shared by every body."""
+    t = ts.tt_jd(jd_tt)
+    return EARTH.at(t), mean_ecliptic_frame.rotation_at(t)
+
+
+@lru_cache(maxsize=8192)
+def _compute_position(planet_name: str, jd_tt: float) -> Tuple[str, float]:
+    """Compute (sign, degree) for a body at a rounded TT Julian date."""
+    observer, rotation = _observer_at(jd_tt)
+    apparent = observer.observe(BODIES[planet_name]).apparent()
+    x, y, _ = mxv(rotation, apparent.xyz.au)
+    longitude = math.degrees(math.atan2(y, x)) % 360
 
-        astrometric = earth.at(t).observe(body)
-        ecliptic = astrometric.apparent().ecliptic_latlon()
-        longitude = ecliptic[1].degrees
+    sign, degree = ecliptic_longitude_to_sign(longitude)
+    return sign, round(degree, 2)
 
-        if longitude < 0:
-            longitude += 360
 
-        sign, degree = ecliptic_longitude_to_sign(longitude)
+@lru_cache(maxsize=8192)
+def _compute_era(jd_ut1: float) -> float:
+    """Earth rotation angle (fraction of a turn) at a rounded UT1 Julian date."""
+    return float(earth_rotation_angle(jd_ut1))
+
+
+def calculate_planet_position(planet_name: str, t) -> PlanetPositionResponse:
+    """Calculate a planet's ecliptic longitude."""
+    try:
+        sign, degree = _compute_position(planet_name, round(t.tt, JD_PRECISION))
         reading = get_reading(planet_name, sign)
 
-        return PlanetPositionResponse(
+        return PlanetPositionResponse.model_construct(
             planet=planet_name,
             sign=sign,
-            degree=round(degree, 2),
+            degree=degree,
             retrograde=False,
             reading=reading
         )
     except Exception as e:
         # Continue with default values on error
-        return PlanetPositionResponse(
+        return PlanetPositionResponse.model_construct(
             planet=planet_name,
             sign='aries',
             degree=0.0,
@@ -261,16 +345,13 @@ def calculate_planet_position(planet_name: str, t, earth) -> PlanetPositionRespo
         )
 
 
-def calculate_rising_sign(t, latitude: float, longitude: float) -> PlanetPositionResponse:
-    """Calculate Ascendant (Rising Sign) using Skyfield."""
-    from skyfield.earthlib import earth_rotation_angle
-
-    era = earth_rotation_angle(t.ut1)
-    lst_degrees = (era * 360 + longitude) % 360
+def calculate_rising_sign(era_360: float, longitude: float) -> PlanetPositionResponse:
+    """Calculate Ascendant (Rising Sign) from the Earth rotation angle in degrees."""
+    lst_degrees = (era_360 + longitude) % 360
     sign, degree = ecliptic_longitude_to_sign(lst_degrees)
     reading = get_reading('ascendant', sign)
 
-    return PlanetPositionResponse(
+    return PlanetPositionResponse.model_construct(
         planet='ascendant',
         sign=sign,
         degree=round(degree, 2),
@@ -281,29 +362,19 @@ def calculate_rising_sign(t, latitude: float, longitude: float) -> PlanetPositio
 
 def calculate_houses(ascendant_longitude: float) -> List[HouseResponse]:
     """Calculate house cusps using Whole Sign house system."""
-    houses = []
-    asc_sign_index = int(ascendant_longitude / 30) % 12
-
-    for i in range(12):
-        house_num = i + 1
-        sign_index = (asc_sign_index + i) % 12
-        sign = SIGNS[sign_index]
-        degree = 0.0
+    row = HOUSE_SIGNS[int(ascendant_longitude / 30) % 12]
+    return [
+        HouseResponse.model_construct(house=i + 1, sign=sign, degree=0.0)
+        for i, sign in enumerate(row)
+    ]
 
-        houses.append(HouseResponse(
-            house=house_num,
-            sign=sign,
-            degree=degree
-        ))
-
-    return houses
 
-
-def generate_summary(sun: PlanetPositionResponse, moon: PlanetPositionResponse, rising: PlanetPositionResponse) -> str:
-    """Generate a personalized chart summary."""
-    sun_sign = sun.sign.title()
-    moon_sign = moon.sign.title()
-    rising_sign = rising.sign.title()
+@cache
+def generate_summary(sun_sign: str, moon_sign: str, rising_sign: str) -> str:
+    """Generate a personalized chart summary from sun, moon and rising signs."""
+    sun_sign = title_sign(sun_sign)
+    moon_sign = title_sign(moon_sign)
+    rising_sign = title_sign(rising_sign)
 
     return (
         f"As a {sun_sign} Sun with a {moon_sign} Moon and {rising_sign} Rising, "
@@ -312,49 +383,71 @@ def generate_summary(sun: PlanetPositionResponse, moon: PlanetPositionResponse,
     )
 
 
+def parse_birth_instant(birth_date: str, birth_time: str) -> datetime:
+    """Parse a birth date and time to minute precision, trying each accepted time layout."""
+    for time_format in BIRTH_TIME_FORMATS:
+        try:
+            birth = datetime.strptime(f"{birth_date} {birth_time}", f"%Y-%m-%d {time_format}")
+        except ValueError:
+            continue
+        return birth.replace(second=0)
+    raise ValueError(f"Unrecognized birth time: {birth_time!r}")
+
+
+def chart_etag(birth: datetime, request: NatalChartRequest) -> str:
+    """Build a strong ETag from the normalized inputs a chart is computed from."""
+    key = f"{CHART_VERSION}|{birth.isoformat()}|{request.latitude!r}|{request.longitude!r}"
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
 @router.post("/calculate", response_model=NatalChartResponse)
-async def calculate_natal_chart(request: NatalChartRequest):
+async def calculate_natal_chart(request: NatalChartRequest, http_request: Request):
     """Calculate a complete natal chart with accurate planetary positions and readings."""
+    headers = {}
     try:
-        date_parts = request.birth_date.split('-')
-        time_parts = request.birth_time.split(':')
-
-        year = int(date_parts[0])
-        month = int(date_parts[1])
-        day = int(date_parts[2])
-        hour = int(time_parts[0])
-        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-
-        t = ts.utc(year, month, day, hour, minute)
+        birth = parse_birth_instant(request.birth_date, request.birth_time)
+        t = ts.utc(birth.year, birth.month, birth.day, birth.hour, birth.minute)
     except Exception as e:
         t = ts.now()
-
-    earth = eph['earth']
-
-    sun = calculate_planet_position('sun', t, earth)
-    moon = calculate_planet_position('moon', t, earth)
-    rising = calculate_rising_sign(t, request.latitude, request.longitude)
+    else:
+        # A parsed birth instant makes the chart a pure function of the request,
+        # so repeat requests are answered before any Skyfield work
+        etag = chart_etag(birth, request)
+        if_none_match = http_request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+        headers["ETag"] = etag
+
+    sun = calculate_planet_position('sun', t)
+    moon = calculate_planet_position('moon', t)
+    era_360 = _compute_era(round(t.ut1, JD_PRECISION)) * 360.0
+    rising = calculate_rising_sign(era_360, request.longitude)
 
     planets = []
     for planet_name in ['mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']:
-        pos = calculate_planet_position(planet_name, t, earth)
+        pos = calculate_planet_position(planet_name, t)
         planets.append(pos)
 
-    from skyfield.earthlib import earth_rotation_angle
-    era = earth_rotation_angle(t.ut1)
-    asc_longitude = (era * 360 + request.longitude) % 360
+    asc_longitude = (era_360 + request.longitude) % 360
     houses = calculate_houses(asc_longitude)
 
-    summary = generate_summary(sun, moon, rising)
+    summary = generate_summary(sun.sign, moon.sign, rising.sign)
 
-    return NatalChartResponse(
+    return json_response(NatalChartResponse(
         sun=sun,
         moon=moon,
         rising=rising,
         planets=planets,
         houses=houses,
         summary=summary
-    )
+    ), headers=headers)
+
+
+def warm_up_ephemeris() -> None:
+    """Evaluate every body once so the first chart request hits warm ephemeris segments."""
+    observer = EARTH.at(ts.now())
+    for body in BODIES.values():
+        observer.observe(body).apparent().frame_latlon(mean_ecliptic_frame)
 
 
 @router.get("/health")
@@ -362,9 +455,7 @@ async def health_check():
     """Check if Skyfield ephemeris is loaded."""
     try:
         t = ts.now()
-        earth = eph['earth']
-        sun = eph['sun']
-        earth.at(t).observe(sun)
+        EARTH.at(t).observe(SUN)
         return {"status": "ok", "ephemeris": "de421.bsp loaded"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -390,13 +481,53 @@ class AIReadingResponse(BaseModel):
     life_themes: List[str]
 
 
+def extract_json_object(text: str) -> Optional[dict]:
+    """Decode the first JSON object in text, or None if it is missing or incomplete."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    try:
+        parsed, _ = json_decoder.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+async def stream_gemini_json(
+    client: httpx.AsyncClient, api_key: str, payload: dict
+) -> Optional[dict]:
+    """Stream a Gemini reply and return its JSON object as soon as it is complete."""
+    url = f"{GEMINI_STREAM_URL}?alt=sse&key={api_key}"
+    text = ""
+
+    async with client.stream("POST", url, json=payload) as response:
+        if response.status_code != 200:
+            return None
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            chunk = json.loads(line[5:])
+            text += chunk.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+
+            # Stop reading once the JSON object has fully arrived
+            parsed = extract_json_object(text)
+            if parsed is not None:
+                return parsed
+
+    return None
+
+
 @router.post("/ai-reading", response_model=AIReadingResponse)
-async def generate_ai_reading(request: AIReadingRequest):
+async def generate_ai_reading(
+    request: AIReadingRequest,
+    gemini_client: Optional[httpx.AsyncClient] = Depends(get_gemini_client),
+):
     """Generate a personalized AI reading based on birth chart data using Gemini."""
-    import os
-    import httpx
-
-    api_key = os.getenv("GEMINI_API_KEY")
+    api_key = settings.gemini_api_key
+    sun_title = title_sign(request.sun_sign)
+    moon_title = title_sign(request.moon_sign)
+    rising_title = title_sign(request.rising_sign)
 
     # Build personalization context
     name_greeting = f"for {request.user_name}" if request.user_name else ""
@@ -410,22 +541,25 @@ async def generate_ai_reading(request: AIReadingRequest):
             pass
 
     # Build the chart summary for the prompt
-    chart_summary = f"""
+    header = f"""
 Birth Chart Analysis {name_greeting}:
 {birth_info}
 
 Core Placements:
-- Sun: {request.sun_sign.title()} at {request.sun_degree:.1f}°
-- Moon: {request.moon_sign.title()} at {request.moon_degree:.1f}°
-- Rising: {request.rising_sign.title()} at {request.rising_degree:.1f}°
+- Sun: {sun_title} at {request.sun_degree:.1f}°
+- Moon: {moon_title} at {request.moon_degree:.1f}°
+- Rising: {rising_title} at {request.rising_degree:.1f}°
 
 Other Planets:
 """
-    for p in request.planets:
-        chart_summary += f"- {p.get('planet', '').title()}: {p.get('sign', '').title()} at {p.get('degree', 0):.1f}°\n"
-
-    # Try Gemini AI if API key is available
-    if api_key:
+    planet_lines = [
+        f"- {p.get('planet', '').title()}: {title_sign(p.get('sign', ''))} at {p.get('degree', 0):.1f}°\n"
+        for p in request.planets
+    ]
+    chart_summary = header + "".join(planet_lines)
+
+    # Try Gemini AI if API key and the shared client are available
+    if api_key and gemini_client is not None:
         try:
             name_instruction = f"Address the person as {request.user_name}." if request.user_name else "Address the person as 'you'."
 
@@ -437,9 +571,9 @@ Please provide a warm, insightful reading. {name_instruction}
 
 Generate:
 1. personalized_reading: A 3-4 sentence overall reading that weaves together the Sun, Moon, and Rising signs. Make it feel personal and specifically about THIS combination.
-2. sun_interpretation: 2 sentences about their core identity based on Sun in {request.sun_sign.title()}
-3. moon_interpretation: 2 sentences about their emotional nature based on Moon in {request.moon_sign.title()}
-4. rising_interpretation: 2 sentences about how others perceive them based on {request.rising_sign.title()} Rising
+2. sun_interpretation: 2 sentences about their core identity based on Sun in {sun_title}
+3. moon_interpretation: 2 sentences about their emotional nature based on Moon in {moon_title}
+4. rising_interpretation: 2 sentences about how others perceive them based on {rising_title} Rising
 5. life_themes: 3 specific life themes based on their unique planetary positions
 
 Be warm, mystical yet grounded. Avoid generic statements. Focus on the unique combination of energies.
@@ -448,41 +582,22 @@ Respond ONLY with valid JSON (no markdown, no extra text):
 {{"personalized_reading": "...", "sun_interpretation": "...", "moon_interpretation": "...", "rising_interpretation": "...", "life_themes": ["...", "...", "..."]}}
 """
 
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent?key={api_key}"
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    url,
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.85,
-                            "maxOutputTokens": 800,
-                        }
-                    }
-                )
-
-                if response.status_code == 200:
-                    import json
-                    import re
-
-                    data = response.json()
-                    text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-
-                    # Try to extract JSON from the response
-                    json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-                    if json_match:
-                        try:
-                            parsed = json.loads(json_match.group())
-                            return AIReadingResponse(
-                                personalized_reading=parsed.get('personalized_reading', ''),
-                                sun_interpretation=parsed.get('sun_interpretation', ''),
-                                moon_interpretation=parsed.get('moon_interpretation', ''),
-                                rising_interpretation=parsed.get('rising_interpretation', ''),
-                                life_themes=parsed.get('life_themes', [])
-                            )
-                        except json.JSONDecodeError:
-                            pass
+            parsed = await stream_gemini_json(gemini_client, api_key, {
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {
+                    "temperature": 0.85,
+                    "maxOutputTokens": 800,
+                }
+            })
+
+            if parsed is not None:
+                return json_response(AIReadingResponse(
+                    personalized_reading=parsed.get('personalized_reading', ''),
+                    sun_interpretation=parsed.get('sun_interpretation', ''),
+                    moon_interpretation=parsed.get('moon_interpretation', ''),
+                    rising_interpretation=parsed.get('rising_interpretation', ''),
+                    life_themes=parsed.get('life_themes', [])
+                ))
 
         except Exception as e:
             pass  # AI reading unavailable
@@ -490,15 +605,15 @@ Respond ONLY with valid JSON (no markdown, no extra text):
     # Fallback to static readings if no API key or error
     name_prefix = f"{request.user_name}, your" if request.user_name else "Your"
 
-    return AIReadingResponse(
-        personalized_reading=f"{name_prefix} unique cosmic blueprint combines the creative fire of {request.sun_sign.title()} Sun with the emotional depth of {request.moon_sign.title()} Moon. With {request.rising_sign.title()} Rising, you present yourself to the world with distinctive charm. This combination creates a beautiful balance between your inner world and outer expression.",
-        sun_interpretation=PLANET_SIGN_READINGS.get('sun', {}).get(request.sun_sign, f"{name_prefix} Sun in {request.sun_sign.title()} illuminates your core essence with unique energy."),
-        moon_interpretation=PLANET_SIGN_READINGS.get('moon', {}).get(request.moon_sign, f"{name_prefix} Moon in {request.moon_sign.title()} colors your emotional landscape."),
-        rising_interpretation=PLANET_SIGN_READINGS.get('ascendant', {}).get(request.rising_sign, f"With {request.rising_sign.title()} Rising, you make a distinctive first impression."),
+    return json_response(AIReadingResponse(
+        personalized_reading=f"{name_prefix} unique cosmic blueprint combines the creative fire of {sun_title} Sun with the emotional depth of {moon_title} Moon. With {rising_title} Rising, you present yourself to the world with distinctive charm. This combination creates a beautiful balance between your inner world and outer expression.",
+        sun_interpretation=PLANET_SIGN_READINGS.get('sun', {}).get(request.sun_sign, f"{name_prefix} Sun in {sun_title} illuminates your core essence with unique energy."),
+        moon_interpretation=PLANET_SIGN_READINGS.get('moon', {}).get(request.moon_sign, f"{name_prefix} Moon in {moon_title} colors your emotional landscape."),
+        rising_interpretation=PLANET_SIGN_READINGS.get('ascendant', {}).get(request.rising_sign, f"With {rising_title} Rising, you make a distinctive first impression."),
         life_themes=[
-            f"Embracing your {request.sun_sign.title()} authenticity",
-            f"Nurturing your {request.moon_sign.title()} emotional wisdom",
-            f"Expressing your {request.rising_sign.title()} Rising confidence"
+            f"Embracing your {sun_title} authenticity",
+            f"Nurturing your {moon_title} emotional wisdom",
+            f"Expressing your {rising_title} Rising confidence"
         ]
-    )
+    ))
 
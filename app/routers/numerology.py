@@ -1,11 +1,17 @@
-from datetime import datetime
-from typing import List
-from fastapi import APIRouter, Depends
+import gzip
+import hashlib
+import time
+from datetime import date
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models import User
-from ..utils import get_current_user
+from ..utils import get_current_user_id, get_active_user_columns
 from ..utils.timezone import get_user_datetime
 
 router = APIRouter(prefix="/numerology", tags=["Numerology"])
@@ -209,6 +215,27 @@ LIFE_PATH_MEANINGS = {
 }
 
 
+# Meanings indexed by any reduced number (0-33), unknown numbers falling back to 1
+LIFE_PATH_BY_NUMBER = tuple(LIFE_PATH_MEANINGS.get(n, LIFE_PATH_MEANINGS[1]) for n in range(34))
+PERSONAL_DAY_BY_NUMBER = tuple(PERSONAL_DAY_MEANINGS.get(n, PERSONAL_DAY_MEANINGS[1]) for n in range(34))
+
+# Meanings serialized once, in the same JSON form as NumerologyResponse
+LIFE_PATH_MEANINGS_JSON = tuple(to_json(m) for m in LIFE_PATH_BY_NUMBER)
+PERSONAL_DAY_MEANINGS_JSON = tuple(to_json(m) for m in PERSONAL_DAY_BY_NUMBER)
+
+# Both meaning tables as one static, publicly cacheable document
+MEANINGS_JSON = to_json({
+    "life_path": {str(n): m for n, m in LIFE_PATH_MEANINGS.items()},
+    "personal_day": {str(n): m for n, m in PERSONAL_DAY_MEANINGS.items()},
+})
+MEANINGS_ETAG = f'"{hashlib.sha1(MEANINGS_JSON).hexdigest()}"'
+
+# Master numbers are never reduced further
+MASTER_NUMBERS = frozenset((11, 22, 33))
+MASTER_ARRAY = np.array(sorted(MASTER_NUMBERS))
+MASTER_MASK = sum(1 << n for n in MASTER_NUMBERS)
+
+
 class NumerologyResponse(BaseModel):
     life_path_number: int
     life_path_meaning: dict
@@ -221,68 +248,202 @@ class NumerologyResponse(BaseModel):
     personality_number: int
 
 
+class NumerologyForecastDay(BaseModel):
+    date: str
+    personal_year: int
+    personal_month: int
+    personal_day: int
+    personal_day_meaning: dict
+
+
 def reduce_to_single(n: int) -> int:
     """Reduce number to single digit (preserve master numbers)."""
-    while n > 9 and n not in [11, 22, 33]:
-        n = sum(int(d) for d in str(n))
+    while n > 9 and not (MASTER_MASK >> n) & 1:
+        total = 0
+        while n:
+            n, digit = divmod(n, 10)
+            total += digit
+        n = total
     return n
 
 
-def calculate_life_path(birth_date: datetime) -> int:
-    """Calculate life path number from birth date."""
-    total = birth_date.year + birth_date.month + birth_date.day
-    return reduce_to_single(total)
+@lru_cache(maxsize=256)
+def _local_date(timezone_str: str, epoch_minute: int) -> Tuple[int, int, int]:
+    """Local (year, month, day) in a timezone during a given epoch minute."""
+    now = get_user_datetime(timezone_str)
+    return now.year, now.month, now.day
+
+
+def user_today(timezone_str: str) -> Tuple[int, int, int]:
+    """Today's local date, reusing the timezone lookup for the rest of the minute."""
+    # UTC offsets are whole minutes, so local midnight never falls inside a bucket
+    return _local_date(timezone_str, int(time.time()) // 60)
 
 
-def calculate_personal_year(birth_date: datetime, current_date: datetime) -> int:
-    """Calculate personal year number."""
-    total = current_date.year + birth_date.month + birth_date.day
-    return reduce_to_single(total)
+def reduce_to_single_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized reduce_to_single over an integer array."""
+    values = values.copy()
+    pending = (values > 9) & ~np.isin(values, MASTER_ARRAY)
+    while pending.any():
+        remaining = values[pending]
+        total = np.zeros_like(remaining)
+        while remaining.any():
+            total += remaining % 10
+            remaining //= 10
+        values[pending] = total
+        pending = (values > 9) & ~np.isin(values, MASTER_ARRAY)
+    return values
 
 
-def calculate_personal_month(personal_year: int, current_month: int) -> int:
-    """Calculate personal month number."""
-    return reduce_to_single(personal_year + current_month)
+@lru_cache(maxsize=4096)
+def _birth_numbers(birth_year: int, birth_month: int, birth_day: int) -> Tuple[int, int, int, int]:
+    """Compute the numbers fixed by a birth date: (life path, destiny, soul, personality)."""
+    life_path = reduce_to_single(birth_year + birth_month + birth_day)
+    destiny = reduce_to_single(birth_day)
+    soul = reduce_to_single(birth_month)
+    personality = reduce_to_single(birth_year)
+    return life_path, destiny, soul, personality
 
 
-def calculate_personal_day(personal_month: int, current_day: int) -> int:
-    """Calculate personal day number."""
-    return reduce_to_single(personal_month + current_day)
+@lru_cache(maxsize=4096)
+def _compute_numbers(
+    birth_year: int, birth_month: int, birth_day: int,
+    today_year: int, today_month: int, today_day: int
+) -> Tuple[int, int, int, int, int, int, int]:
+    """Compute (life path, personal year/month/day, destiny, soul, personality)."""
+    # Birth-only numbers are shared across every day for the same birth date
+    life_path, destiny, soul, personality = _birth_numbers(birth_year, birth_month, birth_day)
+
+    personal_year = reduce_to_single(today_year + birth_month + birth_day)
+    personal_month = reduce_to_single(personal_year + today_month)
+    personal_day = reduce_to_single(personal_month + today_day)
+
+    return life_path, personal_year, personal_month, personal_day, destiny, soul, personality
+
+
+@lru_cache(maxsize=4096)
+def _daily_reading_json(
+    birth_year: int, birth_month: int, birth_day: int,
+    today_year: int, today_month: int, today_day: int
+) -> Tuple[bytes, bytes, str]:
+    """Serialized daily reading, its gzip encoding, and ETag for a birth date on a local day."""
+    (
+        life_path, personal_year, personal_month, personal_day,
+        destiny, soul, personality
+    ) = _compute_numbers(
+        birth_year, birth_month, birth_day,
+        today_year, today_month, today_day
+    )
+
+    # Splice the numbers around the pre-serialized meaning text
+    body = b"".join((
+        b'{"life_path_number":%d,"life_path_meaning":' % life_path,
+        LIFE_PATH_MEANINGS_JSON[life_path],
+        b',"personal_year":%d,"personal_month":%d,"personal_day":%d,"personal_day_meaning":'
+        % (personal_year, personal_month, personal_day),
+        PERSONAL_DAY_MEANINGS_JSON[personal_day],
+        b',"destiny_number":%d,"soul_number":%d,"personality_number":%d}'
+        % (destiny, soul, personality),
+    ))
+    return body, gzip.compress(body, mtime=0), hashlib.sha1(body).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q=0 exclusions."""
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.strip()] = q
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
 
 
 @router.get("/daily", response_model=NumerologyResponse)
-async def get_daily_numerology(
-    current_user: User = Depends(get_current_user),
+def get_daily_numerology(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get daily numerology reading based on user's birth date."""
+    # Only two columns are needed, so skip hydrating the full User
+    user = get_active_user_columns(db, user_id, User.birth_date, User.timezone)
     # Use user's timezone for date calculation
-    today = get_user_datetime(current_user.timezone or 'UTC')
-    birth_date = current_user.birth_date
-
-    # Calculate all numbers
-    life_path = calculate_life_path(birth_date)
-    personal_year = calculate_personal_year(birth_date, today)
-    personal_month = calculate_personal_month(personal_year, today.month)
-    personal_day = calculate_personal_day(personal_month, today.day)
-
-    # Other numbers
-    destiny = reduce_to_single(birth_date.day)
-    soul = reduce_to_single(birth_date.month)
-    personality = reduce_to_single(birth_date.year)
-
-    # Get meanings
-    life_path_meaning = LIFE_PATH_MEANINGS.get(life_path, LIFE_PATH_MEANINGS[1])
-    personal_day_meaning = PERSONAL_DAY_MEANINGS.get(personal_day, PERSONAL_DAY_MEANINGS[1])
-
-    return NumerologyResponse(
-        life_path_number=life_path,
-        life_path_meaning=life_path_meaning,
-        personal_year=personal_year,
-        personal_month=personal_month,
-        personal_day=personal_day,
-        personal_day_meaning=personal_day_meaning,
-        destiny_number=destiny,
-        soul_number=soul,
-        personality_number=personality
+    today_year, today_month, today_day = user_today(user.timezone or 'UTC')
+    birth_date = user.birth_date
+
+    # The reading only changes with the birth date and the local calendar day
+    body, gzipped, digest = _daily_reading_json(
+        birth_date.year, birth_date.month, birth_date.day,
+        today_year, today_month, today_day
     )
+
+    # Serve the precompressed body when the client accepts it
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {"Vary": "Accept-Encoding", "ETag": f'"{digest}-gzip"' if use_gzip else f'"{digest}"'}
+
+    # A 304 carries no body, so it gets no Content-Encoding
+    if_none_match = request.headers.get("if-none-match", "")
+    if headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        body = gzipped
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/meanings")
+async def get_numerology_meanings(request: Request):
+    """Get every life path and personal day meaning (static, CDN-cacheable)."""
+    headers = {"ETag": MEANINGS_ETAG, "Cache-Control": "public, max-age=86400"}
+    if MEANINGS_ETAG in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=MEANINGS_JSON, media_type="application/json", headers=headers)
+
+
+@router.get("/forecast", response_model=List[NumerologyForecastDay])
+def get_numerology_forecast(
+    days: int = 7,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get personal year/month/day numbers for the upcoming days."""
+    days = min(max(days, 1), 366)
+    user = get_active_user_columns(db, user_id, User.birth_date, User.timezone)
+    today = date(*user_today(user.timezone or 'UTC'))
+    birth_date = user.birth_date
+
+    # Split the calendar dates into year/month/day arrays
+    dates = np.arange(np.datetime64(today, 'D'), np.datetime64(today, 'D') + days)
+    month_starts = dates.astype('datetime64[M]')
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    months = month_starts.astype(np.int64) % 12 + 1
+    month_days = (dates - month_starts).astype(np.int64) + 1
+
+    # Same chain as the daily reading, one array pass per step
+    personal_years = reduce_to_single_array(years + birth_date.month + birth_date.day)
+    personal_months = reduce_to_single_array(personal_years + months)
+    personal_days = reduce_to_single_array(personal_months + month_days)
+
+    # Plain dicts in NumerologyForecastDay's shape; no model instances needed
+    forecast = [
+        {
+            "date": str(day),
+            "personal_year": personal_year,
+            "personal_month": personal_month,
+            "personal_day": personal_day,
+            "personal_day_meaning": PERSONAL_DAY_BY_NUMBER[personal_day],
+        }
+        for day, personal_year, personal_month, personal_day in zip(
+            dates.tolist(), personal_years.tolist(), personal_months.tolist(), personal_days.tolist()
+        )
+    ]
+    # Trusted values built above; serialize without response_model re-validation
+    return Response(content=to_json(forecast), media_type="application/json")
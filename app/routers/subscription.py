@@ -1,14 +1,16 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import case, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from ..database import get_db
-from ..models import User, SubscriptionTier
+from ..models import User, SubscriptionTier, WebhookEvent
 from ..schemas.subscription import (
     SubscriptionStatusResponse,
     RevenueCatWebhookEvent,
     RestorePurchaseRequest
 )
-from ..utils import get_current_user
+from ..utils import get_current_user, json_response
 
 router = APIRouter(prefix="/subscription", tags=["Subscription"])
 
@@ -18,13 +20,13 @@ async def get_subscription_status(
     current_user: User = Depends(get_current_user),
 ):
     """Get current user's subscription status."""
-    return SubscriptionStatusResponse(
+    return json_response(SubscriptionStatusResponse.model_construct(
         tier=current_user.subscription_tier.value,
         is_premium=current_user.is_premium,
         expires_at=current_user.subscription_expires_at,
         platform=current_user.subscription_platform,
         product_id=current_user.subscription_product_id,
-    )
+    ))
 
 
 @router.post("/webhook")
@@ -48,19 +50,39 @@ async def handle_revenuecat_webhook(
         subscriber_id = event_data.get("app_user_id", "")
 
         if not subscriber_id:
-            return {"status": "ignored", "reason": "no subscriber_id"}
-
-        # Find user by RevenueCat ID
-        user = db.query(User).filter(User.revenuecat_id == subscriber_id).first()
-
-        if not user:
-            # Try to find by email (fallback)
-            email = event_data.get("subscriber_attributes", {}).get("$email", {}).get("value")
-            if email:
-                user = db.query(User).filter(User.email == email).first()
-
-        if not user:
-            return {"status": "ignored", "reason": "user not found"}
+            print(f"⚠️ RevenueCat webhook ignored: no subscriber_id ({event_type})")
+            return Response(status_code=204)
+
+        # Record the event id first; RevenueCat redeliveries then collide and are skipped
+        event_id = event_data.get("id")
+        if event_id:
+            db.add(WebhookEvent(id=event_id, event_type=event_type))
+            try:
+                db.flush()
+            except IntegrityError:
+                db.rollback()
+                return Response(status_code=204)
+
+        # Find user by RevenueCat ID, falling back to email, in a single query
+        filters = [User.revenuecat_id == subscriber_id]
+        email = event_data.get("subscriber_attributes", {}).get("$email", {}).get("value")
+        if email:
+            filters.append(User.email == email)
+
+        user_id = (
+            db.query(User.id)
+            .filter(or_(*filters))
+            .order_by(case((User.revenuecat_id == subscriber_id, 0), else_=1))
+            .limit(1)
+            .scalar()
+        )
+
+        if not user_id:
+            print(f"⚠️ RevenueCat webhook ignored: user not found for {subscriber_id} ({event_type})")
+            return Response(status_code=204)
+
+        # Collect column changes and write them in one UPDATE, without loading the user
+        values = {}
 
         # Handle different event types
         if event_type in ["INITIAL_PURCHASE", "RENEWAL", "PRODUCT_CHANGE"]:
@@ -68,29 +90,33 @@ async def handle_revenuecat_webhook(
             product_id = event_data.get("product_id", "")
             expiration = event_data.get("expiration_at_ms")
 
-            user.subscription_tier = SubscriptionTier.premium
-            user.subscription_product_id = product_id
+            values["subscription_tier"] = SubscriptionTier.premium
+            values["subscription_product_id"] = product_id
 
             if expiration:
-                user.subscription_expires_at = datetime.fromtimestamp(expiration / 1000)
+                values["subscription_expires_at"] = datetime.fromtimestamp(expiration / 1000)
             else:
                 # Default to 1 month if no expiration provided
-                user.subscription_expires_at = datetime.utcnow() + timedelta(days=30)
+                values["subscription_expires_at"] = datetime.utcnow() + timedelta(days=30)
 
         elif event_type in ["EXPIRATION", "BILLING_ISSUE"]:
             # Subscription expired or payment failed
-            user.subscription_tier = SubscriptionTier.free
+            values["subscription_tier"] = SubscriptionTier.free
 
         elif event_type == "CANCELLATION":
             # User cancelled but subscription remains active until expiry
             # We don't change the tier here, just note it expired at the end date
             pass
 
+        if values:
+            db.execute(update(User).where(User.id == user_id).values(**values))
         db.commit()
         return {"status": "ok", "event_type": event_type}
 
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        # Keep internals out of the response; a 5xx also lets RevenueCat retry
+        print(f"⚠️ RevenueCat webhook error: {e}")
+        return Response(status_code=500)
 
 
 @router.post("/restore")
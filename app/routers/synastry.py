@@ -1,25 +1,63 @@
 """
 Synastry (Relationship Compatibility) Router - AI-powered compatibility deep dive
 """
-import os
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Annotated, Dict, Literal, Optional, List, Tuple
+import httpx
+from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, BeforeValidator
+from pydantic_core import from_json, to_json
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models import User, SynastryReading
+from ..utils import get_current_user, get_gemini_client, json_response
+
+settings = get_settings()
 
-from dotenv import load_dotenv
-load_dotenv()
+router = APIRouter(prefix="/synastry", tags=["Synastry"])
 
-from ..database import get_db
-from ..models import User
-from ..utils import get_current_user
+# Gemini endpoint for readings, with the key baked in; empty when no key is configured
+GEMINI_URL = (
+    "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent"
+    f"?key={settings.gemini_api_key}"
+) if settings.gemini_api_key else ""
+if not GEMINI_URL:
+    print("⚠️ GEMINI_API_KEY not set; synastry AI readings disabled")
+
+# In-memory cache for AI readings: {(sign1, sign2): reading}
+_reading_cache: Dict[Tuple[str, str], str] = {}
+
+# Gemini calls currently in flight, shared by concurrent requests for the same pair
+_inflight_readings: Dict[Tuple[str, str], "asyncio.Task[Optional[str]]"] = {}
+
+# Stored readings older than this are regenerated
+READING_TTL = timedelta(days=30)
+
+# Pairs with no reading available: {(sign1, sign2): monotonic expiry}
+_reading_misses: Dict[Tuple[str, str], float] = {}
+
+# Seconds a miss (no key, nothing stored, or a failed call) is remembered
+READING_MISS_TTL = 300
 
-router = APIRouter(prefix="/synastry", tags=["Synastry"])
+
+# Zodiac sign accepted in requests, matched case-insensitively
+Sign = Annotated[
+    Literal[
+        "aries", "taurus", "gemini", "cancer", "leo", "virgo",
+        "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces",
+    ],
+    BeforeValidator(lambda v: v.lower() if isinstance(v, str) else v),
+]
 
 
 class SynastryRequest(BaseModel):
-    sign1: str
-    sign2: str
+    sign1: Sign
+    sign2: Sign
     birth_date1: Optional[str] = None
     birth_date2: Optional[str] = None
 
@@ -53,41 +91,72 @@ BASE_COMPATIBILITY = {
     "pisces": {"aries": 53, "taurus": 85, "gemini": 45, "cancer": 95, "leo": 55, "virgo": 65, "libra": 62, "scorpio": 93, "sagittarius": 52, "capricorn": 65, "aquarius": 55, "pisces": 88},
 }
 
+# Sign order used to index the precomputed pair tables
+SIGNS = tuple(BASE_COMPATIBILITY)
+SIGN_INDEX = {sign: i for i, sign in enumerate(SIGNS)}
+SIGN_TITLE = {sign: sign.title() for sign in SIGNS}
+
+# BASE_COMPATIBILITY flattened to a 12x12 table indexed [i][j]
+BASE_MATRIX = tuple(
+    tuple(BASE_COMPATIBILITY[a][b] for b in SIGNS) for a in SIGNS
+)
+
+# Gemini prompt for a pair; filled with SIGN_TITLE names and the base score
+PROMPT_TEMPLATE = """As an expert astrologer, provide a personalized synastry reading for a {sign1} and {sign2} relationship.
+
+Their base compatibility score is {score}/100.
+
+Write a warm, insightful 2-3 paragraph reading that covers:
+1. The unique dynamic between these two signs
+2. How their elements and modalities interact
+3. Specific advice for making this relationship thrive
+
+Be specific to these signs, not generic. Use engaging, mystical language. Keep it under 200 words."""
+
+
+def _sub_scores(sign1: str, sign2: str) -> Tuple[int, int, int, int, int]:
+    """Love, friendship, communication, passion and trust scores for a pair."""
+    overall = BASE_COMPATIBILITY[sign1][sign2]
+    rng = random.Random(SIGN_INDEX[sign1] * 12 + SIGN_INDEX[sign2])
+    offsets = (
+        rng.randint(-15, 15),
+        rng.randint(-10, 20),
+        rng.randint(-20, 15),
+        rng.randint(-10, 25),
+        rng.randint(-20, 10),
+    )
+    return tuple(min(100, max(20, overall + offset)) for offset in offsets)
+
+
+# Sub-scores for every pair, indexed [i][j] like BASE_MATRIX
+SUB_SCORES = tuple(tuple(_sub_scores(a, b) for b in SIGNS) for a in SIGNS)
+
 
 @router.post("/analyze", response_model=SynastryResponse)
 async def analyze_synastry(
     request: SynastryRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    gemini_client: Optional[httpx.AsyncClient] = Depends(get_gemini_client),
 ):
     """Get detailed synastry analysis between two zodiac signs with AI insights."""
 
-    sign1 = request.sign1.lower()
-    sign2 = request.sign2.lower()
-
-    if sign1 not in BASE_COMPATIBILITY or sign2 not in BASE_COMPATIBILITY:
-        raise HTTPException(status_code=400, detail="Invalid zodiac sign")
+    sign1 = request.sign1
+    sign2 = request.sign2
 
     # Calculate scores
-    overall = BASE_COMPATIBILITY[sign1][sign2]
+    i, j = SIGN_INDEX[sign1], SIGN_INDEX[sign2]
+    overall = BASE_MATRIX[i][j]
 
-    # Generate sub-scores with some variation
-    import random
-    random.seed(hash(sign1 + sign2))
-
-    love = min(100, max(20, overall + random.randint(-15, 15)))
-    friendship = min(100, max(20, overall + random.randint(-10, 20)))
-    communication = min(100, max(20, overall + random.randint(-20, 15)))
-    passion = min(100, max(20, overall + random.randint(-10, 25)))
-    trust = min(100, max(20, overall + random.randint(-20, 10)))
+    # Sub-scores with some variation, precomputed per pair
+    love, friendship, communication, passion, trust = SUB_SCORES[i][j]
 
     # Get AI reading
-    ai_reading = await _get_ai_synastry_reading(sign1, sign2, overall)
+    ai_reading = await _get_ai_synastry_reading(sign1, sign2, overall, gemini_client)
 
-    # Generate strengths and challenges based on element compatibility
-    strengths, challenges, advice = _get_compatibility_insights(sign1, sign2, overall)
+    # Strengths and challenges based on element compatibility
+    strengths, challenges, advice = PAIR_INSIGHTS[i][j]
 
-    return SynastryResponse(
+    return json_response(SynastryResponse.model_construct(
         overall_score=overall,
         love_score=love,
         friendship_score=friendship,
@@ -98,54 +167,112 @@ async def analyze_synastry(
         challenges=challenges,
         advice=advice,
         ai_reading=ai_reading,
-    )
+    ))
 
 
-async def _get_ai_synastry_reading(sign1: str, sign2: str, score: int) -> Optional[str]:
-    """Generate AI-powered synastry reading."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
+async def _get_ai_synastry_reading(
+    sign1: str, sign2: str, score: int, client: Optional[httpx.AsyncClient]
+) -> Optional[str]:
+    """Generate AI-powered synastry reading (cached per sign pair)."""
+    cache_key = (sign1, sign2)
+    if cache_key in _reading_cache:
+        return _reading_cache[cache_key]
+
+    # Skip the DB lookup and Gemini call for a pair that just came up empty
+    if _reading_misses.get(cache_key, 0.0) > time.monotonic():
         return None
 
-    try:
-        import httpx
+    # Join an identical call already in flight instead of starting another
+    task = _inflight_readings.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_fetch_ai_synastry_reading(sign1, sign2, score, client))
+        _inflight_readings[cache_key] = task
+        task.add_done_callback(lambda _: _inflight_readings.pop(cache_key, None))
 
-        prompt = f"""As an expert astrologer, provide a personalized synastry reading for a {sign1.title()} and {sign2.title()} relationship.
+    # Shielded so one caller disconnecting doesn't cancel the others' reading
+    return await asyncio.shield(task)
 
-Their base compatibility score is {score}/100.
 
-Write a warm, insightful 2-3 paragraph reading that covers:
-1. The unique dynamic between these two signs
-2. How their elements and modalities interact
-3. Specific advice for making this relationship thrive
+async def _fetch_ai_synastry_reading(
+    sign1: str, sign2: str, score: int, client: Optional[httpx.AsyncClient]
+) -> Optional[str]:
+    """Call Gemini for a synastry reading and cache it on success."""
+    cache_key = (sign1, sign2)
 
-Be specific to these signs, not generic. Use engaging, mystical language. Keep it under 200 words."""
+    # Readings stored by any worker survive restarts
+    stored = await run_in_threadpool(_load_stored_reading, sign1, sign2)
+    if stored:
+        _reading_cache[cache_key] = stored
+        return stored
+
+    if not GEMINI_URL or client is None:
+        _reading_misses[cache_key] = time.monotonic() + READING_MISS_TTL
+        return None
 
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent?key={api_key}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.8,
-                        "maxOutputTokens": 400,
-                    }
-                }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-                return text.strip() if text else None
+    try:
+        prompt = PROMPT_TEMPLATE.format(
+            sign1=SIGN_TITLE[sign1], sign2=SIGN_TITLE[sign2], score=score
+        )
+
+        payload = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": 0.8,
+                "maxOutputTokens": 400,
+            }
+        }
+        response = await client.post(
+            GEMINI_URL,
+            content=to_json(payload),
+            headers={"Content-Type": "application/json"},
+        )
+
+        if response.status_code == 200:
+            data = from_json(response.content)
+            text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+            if text:
+                _reading_cache[cache_key] = text.strip()
+                await run_in_threadpool(_store_reading, sign1, sign2, _reading_cache[cache_key])
+                return _reading_cache[cache_key]
 
     except Exception as e:
         print(f"⚠️ Synastry AI error: {e}")
 
+    _reading_misses[cache_key] = time.monotonic() + READING_MISS_TTL
     return None
 
 
+def _load_stored_reading(sign1: str, sign2: str) -> Optional[str]:
+    """Fetch a stored reading for the pair that is still within READING_TTL."""
+    db = SessionLocal()
+    try:
+        return db.query(SynastryReading.reading).filter(
+            SynastryReading.sign1 == sign1,
+            SynastryReading.sign2 == sign2,
+            SynastryReading.created_at >= datetime.utcnow() - READING_TTL,
+        ).scalar()
+    except Exception as e:
+        print(f"⚠️ Synastry reading load error: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def _store_reading(sign1: str, sign2: str, reading: str) -> None:
+    """Insert or refresh the stored reading for the pair."""
+    db = SessionLocal()
+    try:
+        db.merge(SynastryReading(
+            sign1=sign1, sign2=sign2, reading=reading, created_at=datetime.utcnow()
+        ))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Synastry reading store error: {e}")
+    finally:
+        db.close()
+
+
 def _get_compatibility_insights(sign1: str, sign2: str, score: int):
     """Generate compatibility insights based on elements."""
 
@@ -199,3 +326,10 @@ def _get_compatibility_insights(sign1: str, sign2: str, score: int):
         advice = f"While {sign1.title()} and {sign2.title()} face some challenges, growth often comes from differences. Patience, open communication, and mutual respect are key to making this connection work."
 
     return strengths, challenges, advice
+
+
+# Insights for every pair, indexed [i][j] like BASE_MATRIX
+PAIR_INSIGHTS = tuple(
+    tuple(_get_compatibility_insights(a, b, BASE_MATRIX[i][j]) for j, b in enumerate(SIGNS))
+    for i, a in enumerate(SIGNS)
+)
@@ -1,8 +1,10 @@
-from datetime import datetime
+from functools import lru_cache
 import random
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # Load .env for GEMINI_API_KEY
@@ -13,7 +15,7 @@ from ..database import get_db
 from ..models import User, TarotHistory
 from ..schemas import TarotHistoryResponse
 from ..utils import get_current_user
-from ..utils.timezone import get_user_today
+from ..utils.timezone import get_user_day_bounds_utc
 
 router = APIRouter(prefix="/tarot", tags=["Tarot"])
 
@@ -46,6 +48,12 @@ MAJOR_ARCANA = [
     {"id": "world", "name": "The World", "number": 21, "image": "🌍", "image_url": f"{TAROT_IMAGE_BASE}/ar21.jpg"},
 ]
 
+# Cards keyed by id for lookups from history and requests
+MAJOR_ARCANA_BY_ID = {card["id"]: card for card in MAJOR_ARCANA}
+
+# The full deck never changes, so /cards serves it pre-serialized
+MAJOR_ARCANA_JSON = to_json(MAJOR_ARCANA)
+
 # Detailed interpretations for each card
 CARD_INTERPRETATIONS = {
     "fool": {
@@ -314,6 +322,27 @@ CARD_INTERPRETATIONS = {
     },
 }
 
+# Interpretations as parallel tuples indexed by card position * 2 + is_reversed;
+# the extra last pair is an empty reading for unknown card ids
+CARD_INDEX = {card["id"]: i for i, card in enumerate(MAJOR_ARCANA)}
+UNKNOWN_CARD = len(MAJOR_ARCANA)
+_ORIENTED_READINGS = [
+    CARD_INTERPRETATIONS.get(card["id"], {}).get(orientation, {})
+    for card in MAJOR_ARCANA
+    for orientation in ("upright", "reversed")
+] + [{}, {}]
+MEANINGS = tuple(r.get("meaning", "") for r in _ORIENTED_READINGS)
+GUIDANCE = tuple(r.get("daily_guidance", "") for r in _ORIENTED_READINGS)
+KEYWORDS = tuple(r.get("keywords", []) for r in _ORIENTED_READINGS)
+
+
+@lru_cache(maxsize=4096)
+def _seeded_daily_draw(day_seed: int) -> Tuple[dict, bool]:
+    """Deterministic daily card and orientation for a free draw's day seed."""
+    rng = random.Random(day_seed)
+    card = rng.choice(MAJOR_ARCANA)
+    return card, rng.random() < 0.33
+
 
 class DailyTarotResponse(BaseModel):
     card: dict
@@ -327,7 +356,7 @@ class DailyTarotResponse(BaseModel):
 @router.get("/cards")
 async def get_all_cards():
     """Get all tarot cards."""
-    return MAJOR_ARCANA
+    return Response(content=MAJOR_ARCANA_JSON, media_type="application/json")
 
 
 @router.get("/daily", response_model=DailyTarotResponse)
@@ -337,40 +366,38 @@ async def get_daily_card(
     db: Session = Depends(get_db)
 ):
     """Get daily tarot card. Premium users can force a new draw."""
-    # Use user's timezone for date calculation
-    today = get_user_today(current_user.timezone or 'UTC')
+    # Use user's timezone for date calculation; reading_date is stored in UTC
+    today, day_start, day_end = get_user_day_bounds_utc(current_user.timezone or 'UTC')
 
     # Premium users can force a new draw; free users get once per day
     if not force_new or not current_user.is_premium:
         # Check if user already drew today
         existing = db.query(TarotHistory).filter(
             TarotHistory.user_id == current_user.id,
-            TarotHistory.position == "single"
+            TarotHistory.position == "single",
+            TarotHistory.reading_date >= day_start,
+            TarotHistory.reading_date < day_end,
         ).order_by(TarotHistory.reading_date.desc()).first()
 
-        if existing and existing.reading_date.date() == today:
-            card = next((c for c in MAJOR_ARCANA if c["id"] == existing.card_id), None)
-            interp = CARD_INTERPRETATIONS.get(existing.card_id, {})
-            reading_type = "reversed" if existing.is_reversed else "upright"
-            reading = interp.get(reading_type, {})
+        if existing:
+            k = CARD_INDEX.get(existing.card_id, UNKNOWN_CARD) * 2 + bool(existing.is_reversed)
 
             return DailyTarotResponse(
-                card=card,
+                card=MAJOR_ARCANA_BY_ID.get(existing.card_id),
                 is_reversed=existing.is_reversed,
                 already_drawn=True,
-                interpretation=reading.get("meaning", ""),
-                daily_guidance=reading.get("daily_guidance", ""),
-                keywords=reading.get("keywords", [])
+                interpretation=MEANINGS[k],
+                daily_guidance=GUIDANCE[k],
+                keywords=KEYWORDS[k]
             )
 
     # Draw new card - use date seed for free users, true random for premium force_new
     if force_new and current_user.is_premium:
-        random.seed()  # True random for premium users
+        rng = random.Random()  # True random for premium users
+        card = rng.choice(MAJOR_ARCANA)
+        is_reversed = rng.random() < 0.33
     else:
-        day_seed = today.toordinal() + hash(str(current_user.id)) % 1000
-        random.seed(day_seed)
-    card = random.choice(MAJOR_ARCANA)
-    is_reversed = random.random() < 0.33
+        card, is_reversed = _seeded_daily_draw(today.toordinal() + current_user.id.int % 1000)
 
     # Save to history
     history = TarotHistory(
@@ -383,17 +410,15 @@ async def get_daily_card(
     db.commit()
 
     # Get interpretation
-    interp = CARD_INTERPRETATIONS.get(card["id"], {})
-    reading_type = "reversed" if is_reversed else "upright"
-    reading = interp.get(reading_type, {})
+    k = CARD_INDEX[card["id"]] * 2 + is_reversed
 
     return DailyTarotResponse(
         card=card,
         is_reversed=is_reversed,
         already_drawn=False,
-        interpretation=reading.get("meaning", ""),
-        daily_guidance=reading.get("daily_guidance", ""),
-        keywords=reading.get("keywords", [])
+        interpretation=MEANINGS[k],
+        daily_guidance=GUIDANCE[k],
+        keywords=KEYWORDS[k]
     )
 
 
@@ -405,7 +430,8 @@ async def get_three_card_spread(
 ):
     """Get a 3-card spread (past, present, future). Premium users can force new draws."""
     # Use user's timezone for date calculation
-    today = get_user_today(current_user.timezone or 'UTC')
+    # Use user's timezone for date calculation; reading_date is stored in UTC
+    today, day_start, day_end = get_user_day_bounds_utc(current_user.timezone or 'UTC')
     positions = ["past", "present", "future"]
 
     # Premium users can force a new draw; free users get once per day
@@ -413,68 +439,65 @@ async def get_three_card_spread(
         # Check if user already did a spread today
         existing_spread = db.query(TarotHistory).filter(
             TarotHistory.user_id == current_user.id,
-            TarotHistory.position.in_(positions)
+            TarotHistory.position.in_(positions),
+            TarotHistory.reading_date >= day_start,
+            TarotHistory.reading_date < day_end,
         ).order_by(TarotHistory.reading_date.desc()).limit(3).all()
 
-        # Check if the spread is from today
-        if existing_spread and len(existing_spread) == 3:
-            first_card = existing_spread[0]
-            if first_card.reading_date.date() == today:
-                # Return existing spread
-                result = []
-                for entry in reversed(existing_spread):  # Reverse to get past, present, future order
-                    card = next((c for c in MAJOR_ARCANA if c["id"] == entry.card_id), MAJOR_ARCANA[0])
-                    interp = CARD_INTERPRETATIONS.get(entry.card_id, {})
-                    reading_type = "reversed" if entry.is_reversed else "upright"
-                    reading = interp.get(reading_type, {})
-
-                    result.append({
-                        "card": card,
-                        "is_reversed": entry.is_reversed,
-                        "position": entry.position,
-                        "already_drawn": True,
-                        "interpretation": reading.get("meaning", ""),
-                        "daily_guidance": reading.get("daily_guidance", ""),
-                        "keywords": reading.get("keywords", [])
-                    })
-                return result
+        if len(existing_spread) == 3:
+            # Return existing spread
+            result = []
+            for entry in reversed(existing_spread):  # Reverse to get past, present, future order
+                card = MAJOR_ARCANA_BY_ID.get(entry.card_id, MAJOR_ARCANA[0])
+                k = CARD_INDEX.get(entry.card_id, UNKNOWN_CARD) * 2 + bool(entry.is_reversed)
+
+                result.append({
+                    "card": card,
+                    "is_reversed": entry.is_reversed,
+                    "position": entry.position,
+                    "already_drawn": True,
+                    "interpretation": MEANINGS[k],
+                    "daily_guidance": GUIDANCE[k],
+                    "keywords": KEYWORDS[k]
+                })
+            return result
 
 
     # Draw new spread - use date seed for free users, true random for premium force_new
     if force_new and current_user.is_premium:
-        random.seed()  # True random for premium users
+        rng = random.Random()  # True random for premium users
     else:
-        day_seed = today.toordinal() + hash(str(current_user.id)) % 10000 + 1000
-        random.seed(day_seed)
-    shuffled = random.sample(MAJOR_ARCANA, 3)
+        day_seed = today.toordinal() + current_user.id.int % 10000 + 1000
+        rng = random.Random(day_seed)
+    shuffled = rng.sample(MAJOR_ARCANA, 3)
 
     result = []
+    rows = []
     for i, card in enumerate(shuffled):
-        is_reversed = random.random() < 0.33
+        is_reversed = rng.random() < 0.33
 
         # Get interpretation
-        interp = CARD_INTERPRETATIONS.get(card["id"], {})
-        reading_type = "reversed" if is_reversed else "upright"
-        reading = interp.get(reading_type, {})
-
-        history = TarotHistory(
-            user_id=current_user.id,
-            card_id=card["id"],
-            is_reversed=is_reversed,
-            position=positions[i]
-        )
-        db.add(history)
+        k = CARD_INDEX[card["id"]] * 2 + is_reversed
+
+        rows.append({
+            "user_id": current_user.id,
+            "card_id": card["id"],
+            "is_reversed": is_reversed,
+            "position": positions[i],
+        })
 
         result.append({
             "card": card,
             "is_reversed": is_reversed,
             "position": positions[i],
             "already_drawn": False,
-            "interpretation": reading.get("meaning", ""),
-            "daily_guidance": reading.get("daily_guidance", ""),
-            "keywords": reading.get("keywords", [])
+            "interpretation": MEANINGS[k],
+            "daily_guidance": GUIDANCE[k],
+            "keywords": KEYWORDS[k]
         })
 
+    # One multi-row INSERT instead of three ORM objects
+    db.execute(insert(TarotHistory), rows)
     db.commit()
     return result
 
@@ -519,7 +542,7 @@ async def get_ai_tarot_reading(
     import httpx
 
     # Get card details
-    card = next((c for c in MAJOR_ARCANA if c["id"] == request.card_id), None)
+    card = MAJOR_ARCANA_BY_ID.get(request.card_id)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
 
@@ -527,8 +550,8 @@ async def get_ai_tarot_reading(
     orientation = "reversed" if request.is_reversed else "upright"
 
     # Get base interpretation
-    interp = CARD_INTERPRETATIONS.get(request.card_id, {}).get(orientation, {})
-    base_meaning = interp.get("meaning", "")
+    k = CARD_INDEX[request.card_id] * 2 + request.is_reversed
+    base_meaning = MEANINGS[k]
 
     api_key = os.getenv("GEMINI_API_KEY")
 
@@ -601,7 +624,7 @@ Respond ONLY with valid JSON:
 
     return AITarotResponse(
         personalized_reading=f"{name_prefix}{card_name} ({orientation}) has appeared for you today. {base_meaning}{zodiac_flavor}",
-        daily_advice=interp.get("daily_guidance", "Trust your intuition and stay open to the messages around you."),
+        daily_advice=GUIDANCE[k] or "Trust your intuition and stay open to the messages around you.",
         reflection_prompt=f"How does the energy of {card_name} show up in your current situation?",
         affirmation=f"I embrace the wisdom of {card_name} and trust my journey."
     )
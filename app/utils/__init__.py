@@ -4,13 +4,18 @@ from .security import (
     create_access_token,
     create_refresh_token,
     verify_token,
-    get_current_user
+    get_current_user,
+    get_current_user_id,
+    get_active_user_columns
 )
 from .zodiac import get_zodiac_sign_id, get_all_signs, get_sign_by_id
+from .responses import json_response
+from .gemini import get_gemini_client
 
 __all__ = [
     "verify_password", "get_password_hash",
     "create_access_token", "create_refresh_token", "verify_token",
-    "get_current_user",
+    "get_current_user", "get_current_user_id", "get_active_user_columns",
     "get_zodiac_sign_id", "get_all_signs", "get_sign_by_id",
+    "json_response", "get_gemini_client",
 ]
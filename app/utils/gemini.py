@@ -0,0 +1,9 @@
+"""Access to the shared Gemini HTTP client."""
+from typing import Optional
+import httpx
+from fastapi import Request
+
+
+def get_gemini_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """Shared Gemini HTTP client created in the app lifespan, or None before it has run."""
+    return getattr(request.app.state, "gemini_client", None)
@@ -0,0 +1,13 @@
+"""Response helpers for endpoints that serialize Pydantic models directly."""
+from typing import Optional
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel, headers: Optional[dict] = None) -> Response:
+    """Serialize a response model with pydantic-core, skipping jsonable_encoder."""
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -60,28 +60,50 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
         return None
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    """401 raised for missing, invalid, or unknown-user tokens."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
+    """Get the authenticated user's id from the access token without loading the user."""
     payload = verify_token(credentials.credentials)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user_id: str = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    return user_id
+
+
+def get_active_user_columns(db: Session, user_id: str, *columns):
+    """Load only the given User columns for an active user, raising like get_current_user."""
+    row = db.query(User.is_active, *columns).filter(User.id == user_id).first()
+    if row is None:
+        raise _credentials_exception()
 
+    if not row.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+
+    return row
+
+
+def get_current_user(
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get the current authenticated user."""
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
@@ -1,5 +1,6 @@
 """Timezone utilities for user-specific date calculations"""
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+from typing import Tuple
 import pytz
 
 
@@ -13,6 +14,22 @@ def get_user_today(timezone_str: str) -> date:
         return datetime.now(pytz.UTC).date()
 
 
+def get_user_day_bounds_utc(timezone_str: str) -> Tuple[date, datetime, datetime]:
+    """Get today's date in user's timezone plus its [start, end) as naive UTC datetimes"""
+    try:
+        tz = pytz.timezone(timezone_str) if timezone_str else pytz.UTC
+    except Exception:
+        tz = pytz.UTC
+    today = datetime.now(tz).date()
+    start = tz.localize(datetime.combine(today, time.min))
+    end = tz.localize(datetime.combine(today + timedelta(days=1), time.min))
+    return (
+        today,
+        start.astimezone(pytz.UTC).replace(tzinfo=None),
+        end.astimezone(pytz.UTC).replace(tzinfo=None),
+    )
+
+
 def get_user_datetime(timezone_str: str) -> datetime:
     """Get current datetime in user's timezone"""
     try: